@@ -0,0 +1,56 @@
+
+
+import sys
+import os
+
+from cpp_generator import generate_cpp_code, camel_to_snake
+from golden_h_generator import generate_golden_h_code
+from reg_map_parser import parse_reg_map_file
+
+def main():
+    """한 번의 파싱으로 .cpp와 _golden.h를 모두 생성합니다."""
+    if len(sys.argv) != 2:
+        print(f"Usage: python {sys.argv[0]} <input_file>")
+        sys.exit(1)
+
+    input_filepath = sys.argv[1]
+
+    # 클래스 및 파일명 생성
+    base_name = os.path.splitext(os.path.basename(input_filepath))[0]
+    class_name = base_name
+    snake_case_name = camel_to_snake(base_name)
+    cpp_filename = snake_case_name + ".cpp"
+    golden_filename = f"{snake_case_name}_golden.h"
+
+    # Cython이 설치되어 있으면 parse_reg_map.pyx를 즉석 컴파일하여 사용
+    parse_func = parse_reg_map_file
+    try:
+        import pyximport
+        pyximport.install(language_level=3)
+        from parse_reg_map import parse_reg_map_file as parse_func
+    except ImportError:
+        pass
+
+    try:
+        # 입력 파일은 한 번만 파싱하고 두 생성기가 같은 결과를 공유
+        registers, base_address, max_offset = parse_func(input_filepath)
+
+        with open(cpp_filename, 'w', buffering=131072) as f:
+            generate_cpp_code(registers, base_address, max_offset, class_name, f)
+        print(f"Successfully generated {cpp_filename}")
+
+        h_code = generate_golden_h_code(registers)
+        with open(golden_filename, 'w') as f:
+            f.write(h_code)
+        print(f"Successfully generated {golden_filename}")
+
+    except FileNotFoundError:
+        # 존재 여부를 stat으로 미리 묻지 않고 open 실패로 한 번에 처리 (TOCTOU 예방)
+        print(f"Error: File not found at {input_filepath}")
+        sys.exit(1)
+    except Exception as e:
+        print(f"An error occurred: {e}")
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,131 @@
+# cython: language_level=3
+# reg_map_parser.parse_reg_map_file의 Cython 가속 버전.
+# cpp_generator.main()이 pyximport로 즉석 컴파일을 시도하며,
+# Cython이 없으면 순수 파이썬 구현으로 대체됩니다.
+
+from collections import namedtuple
+
+from libc.errno cimport errno, ERANGE
+from libc.stdlib cimport strtol
+
+Register = namedtuple('Register', ['name', 'offset', 'reset_value'])
+
+
+cdef long _hex_to_long(str s) except? -1:
+    "파이썬 int(s, 16) 디스패치를 피하고 strtol로 직접 변환합니다."
+    cdef bytes b = s.encode('ascii')
+    cdef char* start = b
+    cdef char* end = NULL
+    errno = 0
+    cdef long value = strtol(start, &end, 16)
+    # strtol은 잘못된 입력을 조용히 0으로, 오버플로는 ERANGE와 함께 LONG_MAX로
+    # 돌려주므로 토큰 전체가 소비됐는지와 범위를 모두 확인
+    # (순수 파이썬 경로의 int(s, 16) ValueError와 동일한 warn-and-skip 동작 유지)
+    if end == start or end[0] != 0 or errno == ERANGE:
+        raise ValueError(f"invalid literal for int() with base 16: {s!r}")
+    return value
+
+
+cdef long _start_bit(str pos_str) except? -1:
+    "'[15:0]' / '[n]' 형식에서 시작 비트를 파싱합니다."
+    # '[N]' 단일 비트 필드는 콜론 검사 한 번으로 바로 처리
+    if ':' not in pos_str:
+        return int(pos_str[1:-1]) if pos_str.startswith('[') else 0
+    return int(pos_str[pos_str.index(':') + 1:pos_str.rindex(']')])
+
+
+def parse_reg_map_file(filepath):
+    "레지스터 맵 파일을 파싱하여 레지스터 정보 리스트를 반환합니다."
+    cdef list registers = []
+    cdef long address = 0
+    cdef long base_address = -1
+    cdef long current_reg_offset = 0
+    cdef long max_offset = 0
+    cdef long current_reset_acc = 0
+    cdef Py_ssize_t line_num = 0
+    cdef bint current_has_fields = False
+
+    current_reg_name = None
+
+    with open(filepath, 'r', buffering=1 << 17) as f:
+        data = f.read()
+
+    for raw_line in data.splitlines():
+        line_num += 1
+        line = raw_line.strip()
+        if not line:
+            continue
+
+        # split 전에 선행 문자 하나로 들여쓰기(필드 라인) 여부를 분류
+        is_new_register = raw_line[:1] not in (' ', '\t')
+
+        try:
+            if is_new_register:
+                # split 전에 두 번째 토큰이 '0x' 주소인지 확인 (주석 등 잡음 라인 배제)
+                # 첫 구분자는 공백/탭 중 먼저 나오는 쪽
+                sp = line.find(' ')
+                tp = line.find('\t')
+                if sp == -1 or (tp != -1 and tp < sp):
+                    sp = tp
+                i = sp + 1
+                while sp != -1 and line[i] in ' \t':
+                    i += 1
+                if sp == -1 or line[i:i + 2] != '0x':
+                    print(f"Warning: L{line_num}: Skipping non-register line ('{line}')")
+                    continue
+
+                if current_reg_name and current_has_fields:
+                    registers.append(Register(current_reg_name, current_reg_offset, current_reset_acc))
+                    if current_reg_offset > max_offset:
+                        max_offset = current_reg_offset
+
+                current_reset_acc = 0
+                current_has_fields = False
+                current_reg_name = None
+
+                # 앞 6개 토큰까지만 필요하므로 maxsplit으로 제한
+                parts = line.split(None, 5)
+                if len(parts) < 5:
+                    print(f"Warning: L{line_num}: Skipping malformed register line. Not enough parts. ('{line}')")
+                    continue
+
+                reg_name, address_str, field_name, *rest = parts
+                position = rest[-2]
+                reset_str = rest[-1]
+
+                address = _hex_to_long(address_str)
+                if base_address == -1:
+                    base_address = address & 0xFFFFF000
+
+                current_reg_name = reg_name
+                current_reg_offset = address - base_address
+
+                current_reset_acc |= _hex_to_long(reset_str) << _start_bit(position)
+                current_has_fields = True
+
+            else:
+                if not current_reg_name:
+                    print(f"Warning: L{line_num}: Skipping field line with no active register ('{line}')")
+                    continue
+
+                # 꼬리의 position/reset 두 토큰만 떼어내면 충분
+                parts = line.rsplit(None, 2)
+                if len(parts) < 3:
+                    print(f"Warning: L{line_num}: Skipping malformed field line. Not enough parts. ('{line}')")
+                    continue
+
+                field_name, position, reset_str = parts
+
+                current_reset_acc |= _hex_to_long(reset_str) << _start_bit(position)
+                current_has_fields = True
+
+        except (ValueError, IndexError) as e:
+            print(f"Warning: L{line_num}: Could not parse line '{line}'. Error: {e}")
+            continue
+
+    if current_reg_name and current_has_fields:
+        registers.append(Register(current_reg_name, current_reg_offset, current_reset_acc))
+        if current_reg_offset > max_offset:
+            max_offset = current_reg_offset
+
+    return registers, (None if base_address == -1 else base_address), max_offset
@@ -0,0 +1,129 @@
+"""cpp_generator와 golden_h_generator가 공유하는 레지스터 맵 파서."""
+
+from collections import namedtuple
+from functools import lru_cache
+
+Register = namedtuple('Register', ['name', 'offset', 'reset_value'])
+
+# io.DEFAULT_BUFFER_SIZE(8KiB)는 최신 스토리지에 비해 작으므로 128KiB 버퍼를 명시
+_IO_BUFFER_SIZE = 131072
+
+# 같은 위치 문자열('[15:0]', '[0]' 등)이 수백 번 반복되므로 결과를 캐시
+@lru_cache(maxsize=None)
+def parse_bit_position(pos_str):
+    "'[15:0]' 형식의 문자열에서 시작 비트(0)를 파싱합니다."
+    # 형식이 고정되어 있으므로 정규식 대신 슬라이싱으로 직접 파싱
+    # '[N]' 단일 비트 필드는 콜론 검사 한 번으로 바로 처리
+    if ':' not in pos_str:
+        return int(pos_str[1:-1]) if pos_str.startswith('[') else 0
+    return int(pos_str[pos_str.index(':') + 1:pos_str.rindex(']')])
+
+def parse_reg_map_file(filepath):
+    "레지스터 맵 파일을 파싱하여 (레지스터 리스트, 베이스 주소, 최대 오프셋)을 반환합니다."
+    registers = []
+    base_address = None
+    # 파싱하면서 최대 오프셋도 같이 추적 (생성 단계의 max() 재순회 제거)
+    max_offset = 0
+    # 같은 리셋 문자열('0x0', '0x1', '0xffff' 등)이 수천 번 반복되므로 변환 결과를 캐시
+    _hex_cache = {}
+    # 필드를 모았다가 두 번째 패스로 합산하는 대신 파싱하면서 바로 OR 누적
+    current_reset_acc = 0
+    current_has_fields = False
+    current_reg_name = None
+    current_reg_offset = None
+
+    # 한 번에 읽고 바이트로 순회 (라인 단위 read 오버헤드 제거)
+    with open(filepath, 'rb', buffering=_IO_BUFFER_SIZE) as f:
+        data = f.read()
+
+    for line_num, raw_line in enumerate(data.splitlines(), 1):
+        stripped = raw_line.strip()
+        if not stripped:
+            continue
+
+        # 디코딩/split 전에 선행 바이트 하나로 들여쓰기(필드 라인) 여부를 분류
+        is_new_register = raw_line[:1] not in (b' ', b'\t')
+        line = stripped.decode()
+
+        try:
+            if is_new_register:
+                # split 전에 두 번째 토큰이 '0x' 주소인지 확인 (주석 등 잡음 라인 배제)
+                # 첫 구분자는 공백/탭 중 먼저 나오는 쪽
+                sp = line.find(' ')
+                tp = line.find('\t')
+                if sp == -1 or (tp != -1 and tp < sp):
+                    sp = tp
+                i = sp + 1
+                while sp != -1 and line[i] in ' \t':
+                    i += 1
+                if sp == -1 or line[i:i + 2] != '0x':
+                    print(f"Warning: L{line_num}: Skipping non-register line ('{line}')")
+                    continue
+
+                # 이전 레지스터 정보가 있다면 저장
+                if current_reg_name and current_has_fields:
+                    registers.append(Register(current_reg_name, current_reg_offset, current_reset_acc))
+                    if current_reg_offset > max_offset:
+                        max_offset = current_reg_offset
+
+                # 새 레지스터 파싱 시작
+                current_reset_acc = 0
+                current_has_fields = False
+                current_reg_name = None
+
+                # 포맷: reg_name address field_name [permission] position reset_val
+                # 앞 6개 토큰까지만 필요하므로 maxsplit으로 제한
+                parts = line.split(None, 5)
+                if len(parts) < 5:
+                    print(f"Warning: L{line_num}: Skipping malformed register line. Not enough parts. ('{line}')")
+                    continue
+
+                reg_name, address_str, field_name, *rest = parts
+                position = rest[-2]
+                reset_str = rest[-1]
+
+                address = int(address_str, 16)
+                if base_address is None:
+                    base_address = address & 0xFFFFF000 # e.g., 0x40007000
+
+                current_reg_name = reg_name
+                current_reg_offset = address - base_address
+
+                reset_value = _hex_cache.get(reset_str)
+                if reset_value is None:
+                    reset_value = _hex_cache[reset_str] = int(reset_str, 16)
+                current_reset_acc |= reset_value << parse_bit_position(position)
+                current_has_fields = True
+
+            else: # 필드 라인으로 처리
+                if not current_reg_name:
+                    # 활성 레지스터가 없으면 split 없이 바로 건너뜀
+                    print(f"Warning: L{line_num}: Skipping field line with no active register ('{line}')")
+                    continue
+
+                # 포맷: field_name [permission] position reset_val
+                # 꼬리의 position/reset 두 토큰만 떼어내면 충분
+                parts = line.rsplit(None, 2)
+                if len(parts) < 3:
+                    print(f"Warning: L{line_num}: Skipping malformed field line. Not enough parts. ('{line}')")
+                    continue
+
+                field_name, position, reset_str = parts
+
+                reset_value = _hex_cache.get(reset_str)
+                if reset_value is None:
+                    reset_value = _hex_cache[reset_str] = int(reset_str, 16)
+                current_reset_acc |= reset_value << parse_bit_position(position)
+                current_has_fields = True
+
+        except (ValueError, IndexError) as e:
+            print(f"Warning: L{line_num}: Could not parse line '{line}'. Error: {e}")
+            continue
+
+    # 파일 끝에 도달했을 때 마지막 레지스터 정보 저장
+    if current_reg_name and current_has_fields:
+        registers.append(Register(current_reg_name, current_reg_offset, current_reset_acc))
+        if current_reg_offset > max_offset:
+            max_offset = current_reg_offset
+
+    return registers, base_address, max_offset